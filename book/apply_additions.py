@@ -6,9 +6,15 @@ This script reads the *_Additions.md files and inserts them into the
 appropriate locations in the chapter files.
 """
 
+import bisect
+import contextlib
+import mmap
+import os
 import re
+import shutil
 import sys
 import io
+from enum import IntEnum
 from pathlib import Path
 
 # Fix Windows console encoding issues
@@ -16,41 +22,385 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Marker patterns used while parsing the additions files
+_INSERT_AFTER_RE = re.compile(r'Insert after ["\'](.+?)["\']')
+_PAREN_TAIL_RE = re.compile(r'\((.+?)\)$')
+_AFTER_SECTION_RE = re.compile(r'After ["\'](.+?)["\'] [Ss]ection')
+_AFTER_GENERIC_RE = re.compile(r'After (.+?)(?:\(|line|$)')
+_LINE_HINT_RE = re.compile(r'[Ll]ine[~\s]+(\d+)')
+_CHAPTER_NUM_RE = re.compile(r'Chapter_(\d+)')
+_CHAPTER_FILE_RE = re.compile(r'Chapter_(\d+)_')
+_SECTION_START_RE = re.compile(rb'\n## ')
+
+# Line prefixes and header keywords recognised by the additions parser
+_SECTION_TOKENS = frozenset(('SECTION', 'ADDITION'))
+_SECTION_PREFIXES = ('## 🔥', '## 📍')
+_MARKER_PREFIXES = ('**Insert after', '**Location')
+_SKIP_PREFIXES = ('**Insert this section', '**Current Problem')
+
+
+def _iov_max() -> int:
+    """Most chunks a single writev call accepts on this platform."""
+    try:
+        limit = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        limit = -1
+    # Fall back to the POSIX minimum (_XOPEN_IOV_MAX) when the limit is unknown
+    return limit if limit > 0 else 16
+
+
+_IOV_MAX = _iov_max()
+
+# Emoji stripped from section titles when listing them (U+FE0F is the
+# variation selector that follows the shield emoji)
+_EMOJI_STRIP = str.maketrans('', '', '🐛⚡🛡📊🤔\ufe0f')
+
+
+class ParseState(IntEnum):
+    """Where the additions parser is relative to the section headers."""
+    OUTSIDE = 0     # Before the first section header
+    IN_SECTION = 1
+
+
+class ParserContext:
+    """Mutable state shared by the additions line handlers."""
+
+    __slots__ = ('state', 'title', 'buf', 'marker', 'line_hint', 'sections', 'total')
+
+    def __init__(self):
+        self.state = ParseState.OUTSIDE
+        self.title = None
+        self.buf = []
+        self.marker = None
+        self.line_hint = None
+        self.sections = []
+        self.total = 0      # Sections found, including ones without a marker
+
+    def save_section(self):
+        """Save the current section, if it has any content and a marker."""
+        if self.state is not ParseState.IN_SECTION or not self.buf:
+            return
+
+        self.total += 1
+        if not self.marker:
+            print(f"\nWARNING: No insertion marker for: {self.title[:50]}...")
+            print("   Skipping this section")
+            return
+
+        self.sections.append({
+            'title': self.title,
+            'content': '\n'.join(self.buf),
+            'marker': self.marker,
+            'pattern': compile_marker(self.marker),
+            'line_hint': self.line_hint
+        })
+
+
+def _mentions_after(line: str) -> bool:
+    """Check for an 'After "..."' insertion instruction anywhere in the line."""
+    return 'After "' in line or "After '" in line
+
+
+def _read_marker(line: str, ctx: ParserContext):
+    """Extract the insertion marker and line hint from an instruction line."""
+    # Extract the marker - try multiple patterns
+
+    # Pattern 1: **Insert after "Section Title"**
+    match = _INSERT_AFTER_RE.search(line)
+
+    # Pattern 2: **Location**: After line 631 (end of PathConverter code block)
+    if not match:
+        match = _PAREN_TAIL_RE.search(line)  # Extract text in parentheses at end
+
+    # Pattern 3: After "Section Title" Section
+    if not match:
+        match = _AFTER_SECTION_RE.search(line)
+
+    # Pattern 4: Simple "After something"
+    if not match:
+        match = _AFTER_GENERIC_RE.search(line)
+
+    if match:
+        ctx.marker = match.group(1).strip()
+
+    # Extract line number hint
+    match = _LINE_HINT_RE.search(line)
+    if match:
+        ctx.line_hint = int(match.group(1))
+
+
+def _add_subsection(line: str, ctx: ParserContext):
+    """Turn a line containing '### Add:' into a subsection title."""
+    subsection_title = line.replace('### Add:', '').strip().strip('"')
+    ctx.buf.append(f"### {subsection_title}")
+
+
+def _append_content(line: str, ctx: ParserContext):
+    """Keep a regular content line, once the instruction checks have missed."""
+    if ctx.state is ParseState.IN_SECTION and line.strip():
+        ctx.buf.append(line)
+
+
+def _handle_content(line: str, ctx: ParserContext):
+    """Handle a line with no recognised prefix."""
+    if _mentions_after(line):
+        _read_marker(line, ctx)
+    else:
+        _append_content(line, ctx)
+
+
+def _handle_hash(line: str, ctx: ParserContext):
+    """Handle section headers and '### Add:' subsection markers."""
+    # Check for new section headers (multiple formats)
+    if line.startswith('## ') and (any(tok in line for tok in _SECTION_TOKENS) or line.startswith(_SECTION_PREFIXES)):
+        ctx.save_section()
+
+        # Start new section
+        ctx.state = ParseState.IN_SECTION
+        ctx.title = line
+        ctx.buf.clear()
+        ctx.marker = None
+        ctx.line_hint = None
+
+    elif _mentions_after(line):
+        _read_marker(line, ctx)
+
+    elif line.startswith('### Add:'):
+        _add_subsection(line, ctx)
+
+    else:
+        _append_content(line, ctx)
+
+
+def _handle_star(line: str, ctx: ParserContext):
+    """Handle bold instruction lines (insertion markers, skipped notes)."""
+    # Check for insertion instructions (multiple formats)
+    if line.startswith(_MARKER_PREFIXES) or _mentions_after(line):
+        _read_marker(line, ctx)
+
+    elif line.startswith('**Add this section'):
+        if '### Add:' in line:
+            _add_subsection(line, ctx)
 
-def find_insertion_point(content: str, marker: str, line_hint: int = None) -> int:
+    # Skip instruction lines
+    elif not line.startswith(_SKIP_PREFIXES):
+        _append_content(line, ctx)
+
+
+def _handle_dash(line: str, ctx: ParserContext):
+    """Handle section dividers."""
+    if _mentions_after(line):
+        _read_marker(line, ctx)
+
+    elif line.startswith('---') and ctx.state is ParseState.IN_SECTION:
+        if not ctx.buf or ctx.buf[-1] != '---':
+            ctx.buf.append(line)
+
+    else:
+        _append_content(line, ctx)
+
+
+def _handle_gt(line: str, ctx: ParserContext):
+    """Handle blockquotes, which are notes for the editor and never copied."""
+    if _mentions_after(line):
+        _read_marker(line, ctx)
+
+
+# Line handlers keyed on the first character, so each line only runs the
+# prefix checks that can apply to it
+_HANDLERS = {
+    '#': _handle_hash,
+    '*': _handle_star,
+    '-': _handle_dash,
+    '>': _handle_gt,
+}
+
+
+def parse_additions(additions_content: str) -> tuple:
+    """
+    Parse an additions file into the sections to insert.
+
+    Sections without an insertion marker are reported and left out, but
+    still counted in the total.
+
+    Returns:
+        (sections, total) where sections is a list of dicts with the section
+        'title', 'content', insertion 'marker' (and its prepared 'pattern')
+        and 'line_hint', and total is the number of sections found
+    """
+    ctx = ParserContext()
+    get_handler = _HANDLERS.get
+
+    for line in additions_content.split('\n'):
+        get_handler(line[:1], _handle_content)(line, ctx)
+
+    # Save last section
+    ctx.save_section()
+
+    return ctx.sections, ctx.total
+
+
+def compile_marker(marker: str):
+    """
+    Prepare an insertion marker for case-insensitive searching.
+
+    ASCII markers become lowered bytes, found with bytes.find in the
+    lowered chapter. Other markers need Unicode case folding (e.g. "über"
+    matching "Über"), so they get a str pattern and are matched against the
+    decoded chapter.
+    """
+    if marker.isascii():
+        return marker.encode('ascii').lower()
+    return re.compile(re.escape(marker), re.IGNORECASE)
+
+
+def find_insertion_point(content: bytes, content_lower: bytes, section_starts: list, pattern,
+                         line_hint: int = None, text: str = None) -> int:
     """
     Find the insertion point in the content.
 
     Args:
-        content: The chapter content
-        marker: A unique text marker to search for (section title, etc.)
+        content: The chapter content as UTF-8 bytes (may be an mmap)
+        content_lower: The chapter content with ASCII letters lowered
+        section_starts: Sorted positions of the '## ' header lines (see index_sections)
+        pattern: The prepared marker to search for (see compile_marker)
         line_hint: Optional line number hint from the additions file
+        text: The decoded chapter content, required for str patterns
 
     Returns:
-        Character position to insert at, or -1 if not found
+        Byte position to insert at, or -1 if not found
     """
-    lines = content.split('\n')
-
     # Try to find the marker
-    for i, line in enumerate(lines):
-        if marker.lower() in line.lower():
-            # Insert after this section and its content
-            # Find the next section (##) or end of file
-            for j in range(i + 1, len(lines)):
-                if lines[j].startswith('## ') and j > i + 1:
-                    # Found next section, insert before it
-                    return sum(len(lines[k]) + 1 for k in range(j))
+    if isinstance(pattern, bytes):
+        hit = content_lower.find(pattern)
+        if hit < 0:
+            return -1
+    else:
+        match = pattern.search(text)
+        if not match:
+            return -1
+        hit = len(text[:match.start()].encode('utf-8'))
+
+    # Insert after this section and its content
+    # Find the next section (##) at least one line below the marker
+    line_end = content.find(b'\n', hit)
+    if line_end >= 0:
+        idx = bisect.bisect_right(section_starts, line_end + 1)
+        if idx < len(section_starts):
+            # Found next section, insert before it
+            return section_starts[idx]
+
+    # No next section found, insert at end
+    return len(content)
+
+
+def index_sections(content: bytes) -> list:
+    """
+    Find the start of every '## ' header line after the first line.
 
-            # No next section found, insert at end
-            return len(content)
+    Returns:
+        Sorted byte positions, for find_insertion_point
+    """
+    return [match.start() + 1 for match in _SECTION_START_RE.finditer(content)]
 
-    return -1
 
+def map_chapter(f) -> contextlib.AbstractContextManager:
+    """
+    Memory-map an open chapter file read-only.
 
-def apply_chapter_additions(chapter_file: Path, additions_file: Path) -> bool:
+    Empty files cannot be mapped, so they are returned as empty bytes.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def write_chunks(path: Path, chunks: list) -> None:
+    """
+    Write byte chunks to a file without joining them first.
+
+    Uses a single os.writev call where available (POSIX), falling back to
+    plain os.write for the rest of the data.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        written = 0
+        if hasattr(os, 'writev') and len(chunks) <= _IOV_MAX:
+            written = os.writev(fd, chunks)
+
+        total = sum(len(chunk) for chunk in chunks)
+        if written < total:
+            remaining = memoryview(b''.join(chunks))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
+
+def splice_sections(chapter_content: bytes, sections: list) -> tuple:
+    """
+    Insert the parsed sections into the chapter content.
+
+    Returns:
+        (parts, additions_made) where parts are the byte chunks of the
+        modified chapter, in order
+    """
+    inserts = []
+    section_starts = index_sections(chapter_content)
+    # bytes.lower() only folds ASCII, so positions line up with the chapter
+    chapter_lower = chapter_content[:].lower()
+    chapter_text = None
+
+    # Match the chapter's line endings, so CRLF chapters stay uniformly CRLF
+    first_newline = chapter_content.find(b'\n')
+    newline = '\r\n' if first_newline > 0 and chapter_content[first_newline - 1] == ord('\r') else '\n'
+
+    for section in sections:
+        pattern = section['pattern']
+
+        # Non-ASCII markers are matched against the decoded chapter
+        if chapter_text is None and not isinstance(pattern, bytes):
+            chapter_text = bytes(chapter_content).decode('utf-8')
+
+        # Find insertion point
+        pos = find_insertion_point(
+            chapter_content, chapter_lower, section_starts, pattern, section['line_hint'], chapter_text
+        )
+
+        if pos == -1:
+            print(f"\nWARNING: Could not find insertion point for marker: '{section['marker']}'")
+            print("   You may need to manually add this section")
+            continue
+
+        inserts.append((pos, section['content'].replace('\n', newline).encode('utf-8')))
+        print(f"OK: Added: {section['title'][:50]}...")
+
+    # Insert the content (stable sort keeps file order for equal positions)
+    inserts.sort(key=lambda x: x[0])
+    separator = (newline * 2).encode('ascii')
+    parts = []
+    last = 0
+    for pos, content_to_add in inserts:
+        parts.append(chapter_content[last:pos])
+        parts.append(separator)
+        parts.append(content_to_add)
+        parts.append(separator)
+        last = pos
+    parts.append(chapter_content[last:])
+
+    return parts, len(inserts)
+
+
+def apply_chapter_additions(chapter_file: Path, additions_file: Path, confirm: bool = True) -> bool:
     """
     Apply additions from additions_file to chapter_file.
 
+    Args:
+        chapter_file: The chapter to update
+        additions_file: The additions file to apply
+        confirm: Ask before applying; when False, additions are auto-confirmed
+
     Returns:
         True if successful, False otherwise
     """
@@ -59,169 +409,110 @@ def apply_chapter_additions(chapter_file: Path, additions_file: Path) -> bool:
     print(f"Additions from: {additions_file.name}")
     print(f"{'='*60}")
 
-    # Read both files
+    # Read the additions file; the chapter is only checked for here and
+    # memory-mapped once the additions are applied
     try:
-        chapter_content = chapter_file.read_text(encoding='utf-8')
+        chapter_file.stat()
         additions_content = additions_file.read_text(encoding='utf-8')
     except Exception as e:
         print(f"❌ Error reading files: {e}")
         return False
 
     # Parse the additions file into sections
-    sections = []
-    current_section = None
-    current_content = []
-    insertion_marker = None
-    line_hint = None
-
-    for line in additions_content.split('\n'):
-        # Check for new section headers (multiple formats)
-        is_section_header = (
-            (line.startswith('## ') and ('NEW SECTION' in line or 'SECTION' in line or 'ADDITION' in line)) or
-            (line.startswith('## 🔥') or line.startswith('## 📍'))
-        )
-
-        if is_section_header:
-            # Save previous section if exists
-            if current_section and current_content:
-                sections.append({
-                    'title': current_section,
-                    'content': '\n'.join(current_content),
-                    'marker': insertion_marker,
-                    'line_hint': line_hint
-                })
-
-            # Start new section
-            current_section = line
-            current_content = []
-            insertion_marker = None
-            line_hint = None
-
-        # Check for insertion instructions (multiple formats)
-        elif line.startswith('**Insert after') or line.startswith('**Location') or 'After "' in line or "After '" in line:
-            # Extract the marker - try multiple patterns
-
-            # Pattern 1: **Insert after "Section Title"**
-            match = re.search(r'Insert after ["\'](.+?)["\']', line)
-
-            # Pattern 2: **Location**: After line 631 (end of PathConverter code block)
-            if not match:
-                match = re.search(r'\((.+?)\)$', line)  # Extract text in parentheses at end
-
-            # Pattern 3: After "Section Title" Section
-            if not match:
-                match = re.search(r'After ["\'"](.+?)["\'"] [Ss]ection', line)
-
-            # Pattern 4: Simple "After something"
-            if not match:
-                match = re.search(r'After (.+?)(?:\(|line|$)', line)
-
-            if match:
-                insertion_marker = match.group(1).strip()
-
-            # Extract line number hint
-            match = re.search(r'[Ll]ine[~\s]+(\d+)', line)
-            if match:
-                line_hint = int(match.group(1))
-
-        # Check for "Add this section" markers
-        elif line.startswith('### Add:') or line.startswith('**Add this section'):
-            # This is a subsection title, extract it
-            if '### Add:' in line:
-                subsection_title = line.replace('### Add:', '').strip().strip('"')
-                current_content.append(f"### {subsection_title}")
-            continue
-
-        # Check for section dividers
-        elif line.startswith('---') and current_section:
-            if not current_content or current_content[-1] != '---':
-                current_content.append(line)
-
-        # Skip instruction lines
-        elif line.startswith('**Insert this section') or line.startswith('**Current Problem'):
-            continue
-
-        # Regular content
-        elif current_section and line.strip() and not line.startswith('>'):
-            current_content.append(line)
-
-    # Save last section
-    if current_section and current_content:
-        sections.append({
-            'title': current_section,
-            'content': '\n'.join(current_content),
-            'marker': insertion_marker,
-            'line_hint': line_hint
-        })
+    sections, total_sections = parse_additions(additions_content)
 
-    if not sections:
+    if not total_sections:
         print("WARNING: No sections found in additions file")
         return False
 
     print(f"\nFound {len(sections)} sections to add:")
     for i, section in enumerate(sections, 1):
-        title = section['title'].replace('## ', '').replace('🐛 ', '').replace('⚡ ', '').replace('🛡️ ', '').replace('📊 ', '').replace('🤔 ', '')
+        title = section['title'].removeprefix('## ').translate(_EMOJI_STRIP).lstrip()
         print(f"  {i}. {title[:60]}...")
 
-    # Auto-confirm if running non-interactively
-    try:
-        response = input("\nApply these additions? (y/n): ").strip().lower()
-        if response != 'y':
-            print("Cancelled")
-            return False
-    except EOFError:
-        # Non-interactive mode, auto-confirm
+    # Auto-confirm if running non-interactively (stdin is not a terminal,
+    # so don't block on reading it)
+    if confirm and not (sys.stdin and sys.stdin.isatty()):
+        confirm = False
+
+    if confirm:
+        try:
+            response = input("\nApply these additions? (y/n): ").strip().lower()
+            if response != 'y':
+                print("Cancelled")
+                return False
+        except EOFError:
+            # Non-interactive mode, auto-confirm
+            confirm = False
+
+    if not confirm:
         print("Auto-confirming (non-interactive mode)")
-        pass
 
     # Apply each section
-    modified_content = chapter_content
-    additions_made = 0
-
-    for section in sections:
-        marker = section['marker']
-        content_to_add = section['content']
-
-        if not marker:
-            print(f"\nWARNING: No insertion marker for: {section['title'][:50]}...")
-            print("   Skipping this section")
-            continue
-
-        # Find insertion point
-        pos = find_insertion_point(modified_content, marker, section['line_hint'])
-
-        if pos == -1:
-            print(f"\nWARNING: Could not find insertion point for marker: '{marker}'")
-            print("   You may need to manually add this section")
-            continue
-
-        # Insert the content
-        modified_content = (
-            modified_content[:pos] +
-            "\n\n" + content_to_add + "\n\n" +
-            modified_content[pos:]
-        )
-
-        additions_made += 1
-        print(f"OK: Added: {section['title'][:50]}...")
+    # The chapter is searched as mapped UTF-8 bytes; positions are computed
+    # against the original content and spliced in a single pass at the end,
+    # so only the sections being inserted are ever encoded.
+    try:
+        with open(chapter_file, 'rb') as f, map_chapter(f) as chapter_content:
+            parts, additions_made = splice_sections(chapter_content, sections)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading files: {e}")
+        return False
 
     if additions_made == 0:
         print("\nERROR: No additions were made")
         return False
 
-    # Create backup
+    # Work on the real file when the chapter is a symlink, so the link is
+    # kept and its target is what gets updated
+    target_file = chapter_file.resolve()
+
+    # Create backup (the file on disk is still the original, so link or copy
+    # it rather than writing the content out again)
     backup_file = chapter_file.with_suffix('.md.backup')
-    backup_file.write_text(chapter_content, encoding='utf-8')
+    try:
+        if backup_file.exists() or backup_file.is_symlink():
+            backup_file.unlink()
+        os.link(target_file, backup_file)
+    except OSError:
+        shutil.copyfile(target_file, backup_file)
     print(f"\nBackup created: {backup_file.name}")
 
-    # Write modified content
-    chapter_file.write_text(modified_content, encoding='utf-8')
+    # Write modified content to a new file and swap it in, so a hard-linked
+    # backup keeps the original content
+    tmp_file = target_file.with_name(target_file.name + '.tmp')
+    write_chunks(tmp_file, parts)
+    shutil.copymode(target_file, tmp_file)
+    os.replace(tmp_file, target_file)
     print(f"SUCCESS: Updated: {chapter_file.name}")
-    print(f"   {additions_made}/{len(sections)} sections added successfully")
+    print(f"   {additions_made}/{total_sections} sections added successfully")
 
     return True
 
 
+def apply_in_worker(chapter_file: Path, additions_files: list) -> tuple:
+    """
+    Apply additions in a worker process without prompting.
+
+    All additions files for one chapter go to the same worker and are
+    applied in order, since each one rewrites the chapter and its backup.
+
+    Returns:
+        (success_count, output) where output is everything the run printed,
+        so the parent can report each chapter in order instead of interleaved
+    """
+    output = io.StringIO()
+    success_count = 0
+    with contextlib.redirect_stdout(output):
+        for additions_file in additions_files:
+            try:
+                if apply_chapter_additions(chapter_file, additions_file, confirm=False):
+                    success_count += 1
+            except Exception as e:
+                print(f"❌ Error applying {additions_file.name}: {e}")
+    return success_count, output.getvalue()
+
+
 def main():
     """Main entry point."""
     book_dir = Path(__file__).parent
@@ -237,24 +528,63 @@ def main():
     for f in addition_files:
         print(f"  - {f.name}")
 
-    # Process each one
-    success_count = 0
+    # Index the chapter files by number (they might have different naming)
+    chapters_by_num = {}
+    for entry in os.scandir(book_dir):
+        if not entry.name.endswith('.md') or 'Additions' in entry.name or 'backup' in entry.name:
+            continue
+        match = _CHAPTER_FILE_RE.match(entry.name)
+        if match:
+            chapters_by_num.setdefault(match.group(1), Path(entry.path))
+
+    # Pair each one with its chapter file
+    pairs = []
     for additions_file in addition_files:
         # Find corresponding chapter file
-        chapter_num = re.search(r'Chapter_(\d+)', additions_file.name).group(1)
+        match = _CHAPTER_NUM_RE.search(additions_file.name)
+        chapter_file = match and chapters_by_num.get(match.group(1))
 
-        # Try to find the chapter file (might have different naming)
-        chapter_files = list(book_dir.glob(f'Chapter_{chapter_num}_*.md'))
-        chapter_files = [f for f in chapter_files if 'Additions' not in f.name and 'backup' not in f.name]
-
-        if not chapter_files:
+        if not chapter_file:
             print(f"\nWARNING: No chapter file found for {additions_file.name}")
             continue
 
-        chapter_file = chapter_files[0]
+        pairs.append((chapter_file, additions_file))
+
+    # Group the additions by chapter (in file order), so different chapters
+    # can run in parallel but a chapter is never written twice at once
+    by_chapter = {}
+    for chapter_file, additions_file in pairs:
+        by_chapter.setdefault(chapter_file, []).append(additions_file)
 
-        if apply_chapter_additions(chapter_file, additions_file):
-            success_count += 1
+    # Process each one
+    success_count = 0
+    interactive = bool(sys.stdin and sys.stdin.isatty())
+    workers = min(len(by_chapter), os.cpu_count() or 1)
+    if interactive or workers < 2:
+        # Interactive runs prompt per chapter, and a single worker would only
+        # add process start-up cost, so these stay sequential
+        for chapter_file, additions_file in pairs:
+            if apply_chapter_additions(chapter_file, additions_file, confirm=interactive):
+                success_count += 1
+    else:
+        # Imported here since concurrent.futures alone is a noticeable share
+        # of start-up time for sequential runs
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Print each chapter's output in file order once it is done
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = {
+                chapter_file: ex.submit(apply_in_worker, chapter_file, additions_files)
+                for chapter_file, additions_files in by_chapter.items()
+            }
+            for chapter_file, fut in futures.items():
+                try:
+                    chapter_successes, output = fut.result()
+                except Exception as e:
+                    print(f"\n❌ Error processing {chapter_file.name}: {e}")
+                    continue
+                print(output, end='')
+                success_count += chapter_successes
 
     print(f"\n{'='*60}")
     print(f"SUCCESS: Processed {success_count}/{len(addition_files)} files")